@@ -4,8 +4,11 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .parser import SlackMessageParser, SlackMessage
-from .filters import TimeRangeFilter, RegexFilter, AuthorFilter, SlackMessageFilter
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .parser import SlackMessageParser, SlackMessage
+    from .filters import TimeRangeFilter, RegexFilter, AuthorFilter, SlackMessageFilter
 
 __all__ = [
     "SlackMessageParser",
@@ -15,3 +18,30 @@ __all__ = [
     "AuthorFilter",
     "SlackMessageFilter",
 ]
+
+# Public names are loaded on first access (PEP 562) to keep `import slackdump`
+# and CLI start-up cheap
+_LAZY_IMPORTS = {
+    "SlackMessageParser": "parser",
+    "SlackMessage": "parser",
+    "TimeRangeFilter": "filters",
+    "RegexFilter": "filters",
+    "AuthorFilter": "filters",
+    "SlackMessageFilter": "filters",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Include lazily loaded public names in dir(slackdump)."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,17 +4,55 @@ import argparse
 from argparse import Namespace
 import sys
 from datetime import datetime
-from typing import Any, List
+from typing import Any, List, Optional
 
 from .filters import AuthorFilter, RegexFilter, SlackMessageFilter, TimeRangeFilter
 from .parser import SlackMessageParser
 
+# Accepted separators between date and time, keyed by input length; only
+# these shapes are handed to fromisoformat so it never widens the formats
+_ISO_SEPARATORS = {10: "", 16: " ", 19: " T"}
+
+# Fallback formats with the shortest and longest input strptime can match
+# for each; a space in a format matches any run of whitespace, hence None
+_STRPTIME_FORMATS = (
+    ("%Y-%m-%d", 8, 10),
+    ("%Y-%m-%d %H:%M:%S", 14, None),
+    ("%Y-%m-%dT%H:%M:%S", 14, 19),
+    ("%Y-%m-%d %H:%M", 11, None),
+)
+
+
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    """Fast path for supported formats that are also valid ISO 8601."""
+    separators = _ISO_SEPARATORS.get(len(date_str))
+    if separators is None or date_str[4:5] != "-" or date_str[7:8] != "-":
+        return None
+
+    if separators:
+        if date_str[10] not in separators or date_str[13] != ":":
+            return None
+        if len(date_str) == 19 and date_str[16] != ":":
+            return None
+
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+    return parsed if parsed.tzinfo is None else None
+
 
 def parse_datetime(date_str: str) -> datetime:
     """Parse datetime string in multiple formats."""
-    formats = ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M"]
+    parsed = _parse_iso(date_str)
+    if parsed is not None:
+        return parsed
 
-    for fmt in formats:
+    length = len(date_str)
+    for fmt, min_length, max_length in _STRPTIME_FORMATS:
+        if length < min_length or (max_length is not None and length > max_length):
+            continue
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -78,19 +116,20 @@ Examples:
 
 def print_preview(messages: List[Any], total_count: int) -> None:
     """Print first 10 messages to stdout with pagination hint."""
-    print(f"\n📋 Showing first 10 of {total_count} messages:\n")
+    # Collect the lines and print them in one call rather than one per line
+    lines = [f"\n📋 Showing first 10 of {total_count} messages:\n"]
 
     for i, msg in enumerate(messages[:10], 1):
-        msg_dict = msg.to_dict()
-        datetime_str = msg_dict["datetime"][:19]
-        user = msg_dict["user"]
-        text = msg_dict["text"][:100]
-        print(f"{i:2d}. [{datetime_str}] {user}: {text}")
-        if len(msg_dict["text"]) > 100:
-            print("    ...")
+        datetime_str = msg.datetime.isoformat()[:19]
+        text = msg.text[:100]
+        lines.append(f"{i:2d}. [{datetime_str}] {msg.user}: {text}")
+        if len(msg.text) > 100:
+            lines.append("    ...")
 
     if total_count > 10:
-        print(f"\n💡 Use --output to save all {total_count} messages to a file")
+        lines.append(f"\n💡 Use --output to save all {total_count} messages to a file")
+
+    print("\n".join(lines))
 
 
 def validate_inputs(args: Namespace) -> None:
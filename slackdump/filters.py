@@ -2,39 +2,88 @@
 
 import re
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Any, Callable, FrozenSet, List, Optional
 
 from .parser import SlackMessage
 
+# Syntax re2 accepts but matches differently from re: ASCII-only \w, \d, \s
+# and \b, a $ that ignores a trailing newline, POSIX [:classes:] and a
+# literal (rather than repeating) {,n}
+_RE2_DIVERGENT_SYNTAX = re.compile(r"\\[wWdDsSbB]|\$|\[:|\{,")
+
+# Case-insensitive re also folds i/I with dotless \u0131 and dotted \u0130,
+# which re2 does not; keep re for any pattern (or class, or code point
+# escape) that could involve those letters
+_RE2_DIVERGENT_CASE_FOLD = re.compile(r"[iI\u0130\u0131\[]|\\[xuUN0-7]")
+_INLINE_IGNORECASE = re.compile(r"\(\?[a-zA-Z]*i")
+
+# re2 pays a per-call setup cost (including UTF-8 encoding the text) that
+# makes it slower than re on typical chat messages; it only pulls ahead on
+# texts around this long, so shorter ones keep using re
+_RE2_MIN_TEXT_LENGTH = 1024
+
 
 class SlackMessageFilter:
     """Base class for message filters."""
 
+    # Rough relative cost per message; fuse() runs cheaper filters first
+    _cost = 3
+
     def __call__(self, message: SlackMessage) -> bool:
         """Return True if message should be included."""
         raise NotImplementedError("Subclasses must implement __call__")
 
+    @staticmethod
+    def fuse(filters: List["SlackMessageFilter"]) -> Callable[[SlackMessage], bool]:
+        """Combine filters into one predicate that checks cheapest first."""
+        ordered = sorted(
+            filters,
+            key=lambda filter_obj: getattr(
+                type(filter_obj), "_cost", SlackMessageFilter._cost
+            ),
+        )
+
+        if len(ordered) == 1:
+            return ordered[0]
+
+        def fused(message: SlackMessage) -> bool:
+            for filter_obj in ordered:
+                if not filter_obj(message):
+                    return False
+            return True
+
+        return fused
+
 
 class TimeRangeFilter(SlackMessageFilter):
     """Filter messages by date/time range."""
 
+    _cost = 1
+
     def __init__(
         self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None
     ):
         self.start_time = start_time
         self.end_time = end_time
 
-        if start_time and end_time and start_time > end_time:
+        if start_time is not None and end_time is not None and start_time > end_time:
             raise ValueError("start_time must be before end_time")
 
+        # Compare raw epoch seconds so messages never build a datetime here.
+        # Bounds are instants: across a DST change a naive bound in the
+        # repeated hour means its first occurrence, so an end of 01:45 on a
+        # fall-back night excludes the second 01:30, which comes later
+        self._start_ts = start_time.timestamp() if start_time is not None else None
+        self._end_ts = end_time.timestamp() if end_time is not None else None
+
     def __call__(self, message: SlackMessage) -> bool:
         """Check if message timestamp falls within the specified range."""
-        msg_datetime = message.datetime
+        timestamp = message.timestamp
 
-        if self.start_time and msg_datetime < self.start_time:
+        if self._start_ts is not None and timestamp < self._start_ts:
             return False
 
-        if self.end_time and msg_datetime > self.end_time:
+        if self._end_ts is not None and timestamp > self._end_ts:
             return False
 
         return True
@@ -43,6 +92,8 @@ class TimeRangeFilter(SlackMessageFilter):
 class RegexFilter(SlackMessageFilter):
     """Filter messages by regex pattern."""
 
+    _cost = 2
+
     def __init__(self, pattern: str, case_sensitive: bool = False):
         self.pattern = pattern
         self.case_sensitive = case_sensitive
@@ -54,19 +105,49 @@ class RegexFilter(SlackMessageFilter):
         except re.error as e:
             raise ValueError(f"Invalid regex pattern '{pattern}': {e}")
 
+        self._search: Callable[[str], Any] = self.regex.search
+        self._re2_search: Optional[Callable[[str], Any]] = None
+        if _RE2_DIVERGENT_SYNTAX.search(pattern):
+            return
+        if not case_sensitive or _INLINE_IGNORECASE.search(pattern):
+            if _RE2_DIVERGENT_CASE_FOLD.search(pattern):
+                return
+
+        try:
+            import re2
+        except ImportError:  # pragma: no cover - optional dependency
+            return
+
+        options = re2.Options()
+        options.case_sensitive = case_sensitive
+        options.log_errors = False
+        try:
+            self._re2_search = re2.compile(pattern, options).search
+        except re2.error:
+            pass  # Unsupported syntax (e.g. lookaround), keep re
+
     def __call__(self, message: SlackMessage) -> bool:
         """Check if message text matches the regex pattern."""
-        return bool(self.regex.search(message.text))
+        text = message.text
+        if self._re2_search is not None and len(text) >= _RE2_MIN_TEXT_LENGTH:
+            try:
+                return bool(self._re2_search(text))
+            except UnicodeEncodeError:
+                pass  # Lone surrogates have no UTF-8 form for re2; re copes
+
+        return bool(self._search(text))
 
 
 class AuthorFilter(SlackMessageFilter):
     """Filter messages by user IDs."""
 
+    _cost = 0
+
     def __init__(self, user_ids: List[str]):
-        if not user_ids:
-            raise ValueError("user_ids cannot be empty")
+        self.user_ids: FrozenSet[str] = frozenset(user_ids)
 
-        self.user_ids: Set[str] = set(user_ids)
+        if not self.user_ids:
+            raise ValueError("user_ids cannot be empty")
 
     def __call__(self, message: SlackMessage) -> bool:
         """Check if message author is in the allowed user set."""
@@ -1,21 +1,131 @@
 """Core Slack API interaction and message parsing functionality."""
 
 import csv
+import hashlib
 import json
 import os
+import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
-
-import requests
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .filters import SlackMessageFilter
 
+# Exports issue many small writes; a larger buffer keeps syscalls down
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Characters that make csv.writer quote a field (default excel dialect)
+_CSV_NEEDS_QUOTING = re.compile(r'[",\r\n]')
+
+
+# Successful auth.test results are trusted across CLI runs for this long
+_AUTH_CACHE_TTL = 600
+
+# API errors meaning the token no longer works, so its cache entry is stale
+_TOKEN_REJECTED_ERRORS = frozenset(
+    {"invalid_auth", "not_authed", "token_revoked", "account_inactive"}
+)
+
+
+def _auth_cache_path() -> str:
+    """Location of the verified-token cache, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "slackdump", "auth")
+
+
+def _read_auth_cache() -> Dict[str, float]:
+    """Load {token fingerprint: expiry epoch}; a missing or bad file is empty."""
+    try:
+        with open(_auth_cache_path(), encoding="utf-8") as f:
+            entries = json.load(f)
+        return {str(k): float(v) for k, v in entries.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _write_auth_cache(entries: Dict[str, float]) -> None:
+    """Persist unexpired cache entries, ignoring filesystem errors."""
+    now = time.time()
+    path = _auth_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in entries.items() if v > now}, f)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _load_orjson() -> Any:
+    """Import orjson on first use, or None if it is not installed."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return orjson
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Pretty-print obj as JSON, using orjson when it is installed."""
+    orjson = _load_orjson()
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+            return encoded.decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; json handles these
+
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write_csv_rows(f: Any, writer: Any, messages: List["SlackMessage"]) -> None:
+    """Write one CSV row per message, matching writer.writerow output."""
+    # Most rows need no quoting, so format those directly and only hand rows
+    # with special characters to csv.writer
+    needs_quoting = _CSV_NEEDS_QUOTING.search
+    for msg in messages:
+        thread_ts = msg.thread_ts or ""
+        if (
+            needs_quoting(msg.text)
+            or needs_quoting(msg.user)
+            or needs_quoting(msg.channel)
+            or needs_quoting(thread_ts)
+        ):
+            writer.writerow(
+                [
+                    msg.datetime.isoformat(),
+                    msg.user,
+                    msg.text,
+                    msg.channel,
+                    thread_ts,
+                    msg.reply_count,
+                ]
+            )
+        else:
+            f.write(
+                f"{msg.datetime.isoformat()},{msg.user},{msg.text},"
+                f"{msg.channel},{thread_ts},{msg.reply_count}\r\n"
+            )
+
 
 class SlackMessage:
     """Data class representing a Slack message."""
 
+    __slots__ = (
+        "text",
+        "user",
+        "timestamp",
+        "channel",
+        "thread_ts",
+        "reply_count",
+        "reactions",
+        "_datetime",
+    )
+
     def __init__(
         self,
         text: str,
@@ -33,11 +143,14 @@ class SlackMessage:
         self.thread_ts = thread_ts
         self.reply_count = reply_count
         self.reactions = reactions or []
+        self._datetime: Optional[datetime] = None
 
     @property
     def datetime(self) -> datetime:
-        """Convert timestamp to datetime object."""
-        return datetime.fromtimestamp(self.timestamp)
+        """Convert timestamp to datetime object (computed once, on first use)."""
+        if self._datetime is None:
+            self._datetime = datetime.fromtimestamp(self.timestamp)
+        return self._datetime
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary for export."""
@@ -56,17 +169,62 @@ class SlackMessage:
 class SlackMessageParser:
     """Main class for interacting with Slack API."""
 
+    # Verified-token expiries already seen in this process, so repeat
+    # parsers skip the disk cache as well as auth.test
+    _verified_until: ClassVar[Dict[str, float]] = {}
+
     def __init__(self, token: str):
+        # Imported here so `slackdump --help/--version` skip the ~100 ms import
+        import requests
+
         self.token = token
         self.session = requests.Session()
         self.session.headers.update(
             {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
         )
 
-        if not self._verify_token():
-            raise ValueError(
-                "Invalid Slack token. Please check your token format (xoxb-...)"
-            )
+        if not self._token_recently_verified():
+            if not self._verify_token():
+                raise ValueError(
+                    "Invalid Slack token. Please check your token format (xoxb-...)"
+                )
+            self._remember_token()
+
+    @property
+    def _token_key(self) -> str:
+        """Fingerprint used to cache verification without storing the token."""
+        return hashlib.blake2b(self.token.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _token_recently_verified(self) -> bool:
+        """Check whether auth.test succeeded for this token within the TTL."""
+        if not self.token.startswith("xoxb-"):
+            return False
+
+        key = self._token_key
+        expiry = self._verified_until.get(key)
+        if expiry is None:
+            expiry = _read_auth_cache().get(key, 0.0)
+            if expiry:
+                self._verified_until[key] = expiry
+
+        return expiry > time.time()
+
+    def _remember_token(self) -> None:
+        """Record a successful verification so later runs can skip auth.test."""
+        key = self._token_key
+        self._verified_until[key] = time.time() + _AUTH_CACHE_TTL
+
+        entries = _read_auth_cache()
+        entries[key] = self._verified_until[key]
+        _write_auth_cache(entries)
+
+    def _forget_token(self) -> None:
+        """Drop a cached verification once Slack rejects the token."""
+        self._verified_until.pop(self._token_key, None)
+
+        entries = _read_auth_cache()
+        if entries.pop(self._token_key, None) is not None:
+            _write_auth_cache(entries)
 
     def _verify_token(self) -> bool:
         """Validate Slack token."""
@@ -81,6 +239,8 @@ class SlackMessageParser:
 
     def _make_request(self, endpoint: str, params: Dict) -> Dict:
         """HTTP requests with rate limiting."""
+        import requests
+
         url = f"https://slack.com/api/{endpoint}"
 
         while True:
@@ -98,6 +258,9 @@ class SlackMessageParser:
 
                 if not data.get("ok", False):
                     error_msg = data.get("error", "Unknown error")
+                    if error_msg in _TOKEN_REJECTED_ERRORS:
+                        self._forget_token()
+
                     if error_msg == "channel_not_found":
                         raise ValueError(
                             "Channel not found. Please check the channel ID "
@@ -172,13 +335,14 @@ class SlackMessageParser:
     def filter_messages(
         self, messages: List[SlackMessage], filters: List["SlackMessageFilter"]
     ) -> List[SlackMessage]:
-        """Apply filters to messages."""
-        filtered_messages = messages
+        """Apply filters to messages in a single pass."""
+        if not filters:
+            return messages
 
-        for filter_obj in filters:
-            filtered_messages = [msg for msg in filtered_messages if filter_obj(msg)]
+        from .filters import SlackMessageFilter
 
-        return filtered_messages
+        predicate = SlackMessageFilter.fuse(filters)
+        return [msg for msg in messages if predicate(msg)]
 
     def export_messages(
         self, messages: List[SlackMessage], output_path: str, format: str = "json"
@@ -195,16 +359,30 @@ class SlackMessageParser:
 
         try:
             if format.lower() == "json":
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(
-                        [msg.to_dict() for msg in messages],
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
+                with open(
+                    output_path,
+                    "w",
+                    encoding="utf-8",
+                    buffering=_EXPORT_BUFFER_SIZE,
+                ) as f:
+                    # Stream one message at a time rather than materializing
+                    # the whole list of dicts; output matches json.dump(indent=2)
+                    f.write("[")
+                    separator = "\n  "
+                    for msg in messages:
+                        f.write(separator)
+                        f.write(_dumps_indented(msg.to_dict()).replace("\n", "\n  "))
+                        separator = ",\n  "
+                    f.write("\n]")
 
             elif format.lower() == "csv":
-                with open(output_path, "w", newline="", encoding="utf-8") as f:
+                with open(
+                    output_path,
+                    "w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=_EXPORT_BUFFER_SIZE,
+                ) as f:
                     writer = csv.writer(f)
                     writer.writerow(
                         [
@@ -217,17 +395,7 @@ class SlackMessageParser:
                         ]
                     )
 
-                    for msg in messages:
-                        writer.writerow(
-                            [
-                                msg.datetime.isoformat(),
-                                msg.user,
-                                msg.text,
-                                msg.channel,
-                                msg.thread_ts or "",
-                                msg.reply_count,
-                            ]
-                        )
+                    _write_csv_rows(f, writer, messages)
             else:
                 raise ValueError(f"Unsupported format: {format}. Use 'json' or 'csv'")
 
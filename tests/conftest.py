@@ -0,0 +1,26 @@
+"""Shared fixtures for SlackDump tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from slackdump import cli
+from slackdump.parser import SlackMessage
+
+
+@pytest.fixture(scope="session")
+def make_message():
+    """Build SlackMessages from test defaults, overriding only what varies."""
+
+    def make(text="test", user="U123", timestamp=1672531200.0, channel="C123"):
+        return SlackMessage(text, user, timestamp, channel)
+
+    return make
+
+
+@pytest.fixture
+def mock_parser_class(monkeypatch):
+    """Replace the SlackMessageParser used by the CLI with a Mock."""
+    parser_class = Mock()
+    monkeypatch.setattr(cli, "SlackMessageParser", parser_class)
+    return parser_class
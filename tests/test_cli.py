@@ -1,5 +1,8 @@
 """Tests for SlackDump CLI functionality."""
 
+import sys
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
@@ -8,6 +11,12 @@ from argparse import ArgumentParser
 from slackdump.cli import parse_datetime, create_parser, print_preview, main
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared argument parser; parse_args() does not mutate it."""
+    return create_parser()
+
+
 class TestParseDatetime:
     """Test datetime parsing functionality."""
 
@@ -35,38 +44,42 @@ class TestParseDatetime:
         expected = datetime(2023, 1, 1, 12, 30)
         assert result == expected
 
+    def test_parse_unpadded_fields(self):
+        """Test parsing dates strptime accepts without zero padding."""
+        assert parse_datetime("2023-1-5") == datetime(2023, 1, 5)
+        assert parse_datetime("2023-1-5 9:05") == datetime(2023, 1, 5, 9, 5)
+
     def test_parse_invalid_format(self):
         """Test parsing invalid date format."""
-        with pytest.raises(ValueError, match="Invalid date format"):
+        with pytest.raises(ValueError) as exc_info:
             parse_datetime("invalid-date")
+        assert "Invalid date format" in str(exc_info.value)
 
     def test_parse_partial_date(self):
         """Test parsing incomplete date."""
-        with pytest.raises(ValueError, match="Invalid date format"):
+        with pytest.raises(ValueError) as exc_info:
             parse_datetime("2023-01")
+        assert "Invalid date format" in str(exc_info.value)
 
     def test_parse_invalid_date_values(self):
         """Test parsing with invalid date values."""
-        with pytest.raises(ValueError, match="Invalid date format"):
+        with pytest.raises(ValueError) as exc_info:
             parse_datetime("2023-13-01")  # Invalid month
+        assert "Invalid date format" in str(exc_info.value)
 
-        with pytest.raises(ValueError, match="Invalid date format"):
+        with pytest.raises(ValueError) as exc_info:
             parse_datetime("2023-01-32")  # Invalid day
+        assert "Invalid date format" in str(exc_info.value)
 
 
 class TestCreateParser:
     """Test argument parser creation."""
 
-    def test_parser_creation(self):
-        """Test that parser is created correctly."""
-        parser = create_parser()
+    def test_required_arguments(self, parser):
+        """Test parser creation and required argument configuration."""
         assert isinstance(parser, ArgumentParser)
         assert parser.prog == "slackdump"
 
-    def test_required_arguments(self):
-        """Test required arguments are properly configured."""
-        parser = create_parser()
-
         # Test with missing required arguments
         with pytest.raises(SystemExit):
             parser.parse_args([])
@@ -76,10 +89,8 @@ class TestCreateParser:
         assert args.token == "xoxb-test"
         assert args.channel == "C123"
 
-    def test_optional_arguments(self):
+    def test_optional_arguments(self, parser):
         """Test optional arguments parsing."""
-        parser = create_parser()
-
         args = parser.parse_args(
             [
                 "--token",
@@ -114,9 +125,8 @@ class TestCreateParser:
         assert args.case_sensitive is True
         assert args.users == ["U123", "U456"]
 
-    def test_default_values(self):
+    def test_default_values(self, parser):
         """Test default values for optional arguments."""
-        parser = create_parser()
         args = parser.parse_args(["--token", "xoxb-test", "--channel", "C123"])
 
         assert args.output is None
@@ -128,10 +138,8 @@ class TestCreateParser:
         assert args.case_sensitive is False
         assert args.users is None
 
-    def test_format_choices(self):
+    def test_format_choices(self, parser):
         """Test format argument choices."""
-        parser = create_parser()
-
         # Valid format
         args = parser.parse_args(
             ["--token", "xoxb-test", "--channel", "C123", "--format", "json"]
@@ -153,77 +161,74 @@ class TestCreateParser:
 class TestPrintPreview:
     """Test preview printing functionality."""
 
-    def test_print_preview_few_messages(self):
+    def test_print_preview_few_messages(self, capsys):
         """Test preview with less than 10 messages."""
-        # Create mock messages
+        # Create lightweight stand-in messages
         messages = []
         for i in range(3):
-            mock_msg = Mock()
-            mock_msg.to_dict.return_value = {
-                "datetime": f"2023-01-0{i+1}T12:00:00",
-                "user": f"U{i}",
-                "text": f"Message {i+1}",
-            }
-            messages.append(mock_msg)
+            messages.append(
+                SimpleNamespace(
+                    datetime=datetime(2023, 1, i + 1, 12),
+                    user=f"U{i}",
+                    text=f"Message {i+1}",
+                )
+            )
 
-        with patch("builtins.print") as mock_print:
-            print_preview(messages, 3)
+        print_preview(messages, 3)
 
-        # Verify print calls
-        mock_print.assert_any_call("\n📋 Showing first 10 of 3 messages:\n")
-        mock_print.assert_any_call(" 1. [2023-01-01T12:00:00] U0: Message 1")
-        mock_print.assert_any_call(" 2. [2023-01-02T12:00:00] U1: Message 2")
-        mock_print.assert_any_call(" 3. [2023-01-03T12:00:00] U2: Message 3")
+        # Verify printed output
+        assert capsys.readouterr().out == (
+            "\n📋 Showing first 10 of 3 messages:\n\n"
+            " 1. [2023-01-01T12:00:00] U0: Message 1\n"
+            " 2. [2023-01-02T12:00:00] U1: Message 2\n"
+            " 3. [2023-01-03T12:00:00] U2: Message 3\n"
+        )
 
-    def test_print_preview_many_messages(self):
+    def test_print_preview_many_messages(self, capsys):
         """Test preview with more than 10 messages."""
-        # Create mock messages
+        # Create lightweight stand-in messages
         messages = []
         for i in range(15):
-            mock_msg = Mock()
-            mock_msg.to_dict.return_value = {
-                "datetime": f"2023-01-{i+1:02d}T12:00:00",
-                "user": f"U{i}",
-                "text": f"Message {i+1}",
-            }
-            messages.append(mock_msg)
+            messages.append(
+                SimpleNamespace(
+                    datetime=datetime(2023, 1, i + 1, 12),
+                    user=f"U{i}",
+                    text=f"Message {i+1}",
+                )
+            )
 
-        with patch("builtins.print") as mock_print:
-            print_preview(messages[:10], 15)  # Only first 10 passed to function
+        print_preview(messages[:10], 15)  # Only first 10 passed to function
 
         # Verify pagination hint is shown
-        mock_print.assert_any_call(
-            "\n💡 Use --output to save all 15 messages to a file"
-        )
+        out = capsys.readouterr().out
+        assert out.endswith("\n\n💡 Use --output to save all 15 messages to a file\n")
 
-    def test_print_preview_long_message(self):
+    def test_print_preview_long_message(self, capsys):
         """Test preview with long message text."""
-        # Create mock message with long text
+        # Create stand-in message with long text
         long_text = (
             "This is a very long message that exceeds 100 characters and should be "
             "truncated in the preview display"
         )
-        mock_msg = Mock()
-        mock_msg.to_dict.return_value = {
-            "datetime": "2023-01-01T12:00:00",
-            "user": "U123",
-            "text": long_text,
-        }
+        mock_msg = SimpleNamespace(
+            datetime=datetime(2023, 1, 1, 12), user="U123", text=long_text
+        )
 
-        with patch("builtins.print") as mock_print:
-            print_preview([mock_msg], 1)
+        print_preview([mock_msg], 1)
 
         # Verify truncation indicator is shown
-        mock_print.assert_any_call("    ...")
+        assert "\n    ...\n" in capsys.readouterr().out
 
 
 class TestMainFunction:
     """Test main CLI function."""
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "invalid-token", "--channel", "C123"])
-    def test_main_invalid_token_format(self, mock_parser):
+    def test_main_invalid_token_format(self, monkeypatch, mock_parser_class):
         """Test main with invalid token format."""
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "invalid-token", "--channel", "C123"]
+        )
+
         with patch("builtins.print") as mock_print:
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -234,13 +239,14 @@ class TestMainFunction:
                 "start with 'xoxb-'"
             )
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch(
-        "sys.argv",
-        ["slackdump", "--token", "xoxb-test", "--channel", "invalid-channel"],
-    )
-    def test_main_invalid_channel_format(self, mock_parser):
+    def test_main_invalid_channel_format(self, monkeypatch, mock_parser_class):
         """Test main with invalid channel format."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["slackdump", "--token", "xoxb-test", "--channel", "invalid-channel"],
+        )
+
         with patch("builtins.print") as mock_print:
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -250,21 +256,20 @@ class TestMainFunction:
                 "❌ Error: Invalid channel format. Channel IDs should start with 'C'"
             )
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"])
-    def test_main_successful_execution(self, mock_parser_class):
+    def test_main_successful_execution(self, monkeypatch, mock_parser_class):
         """Test successful main execution without output file."""
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"]
+        )
+
         # Mock parser instance and methods
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        mock_parser = mock_parser_class.return_value
 
         # Mock messages
         mock_msg = Mock()
-        mock_msg.to_dict.return_value = {
-            "datetime": "2023-01-01T12:00:00",
-            "user": "U123",
-            "text": "Test message",
-        }
+        mock_msg.datetime = datetime(2023, 1, 1, 12)
+        mock_msg.user = "U123"
+        mock_msg.text = "Test message"
         mock_parser.get_channel_messages.return_value = [mock_msg]
         mock_parser.filter_messages.return_value = [mock_msg]
 
@@ -277,24 +282,24 @@ class TestMainFunction:
         mock_parser.get_channel_messages.assert_called_once_with("C123", None)
         mock_preview.assert_called_once()
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch(
-        "sys.argv",
-        [
-            "slackdump",
-            "--token",
-            "xoxb-test",
-            "--channel",
-            "C123",
-            "--output",
-            "test.json",
-        ],
-    )
-    def test_main_with_output_file(self, mock_parser_class):
+    def test_main_with_output_file(self, monkeypatch, mock_parser_class):
         """Test main execution with output file."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "slackdump",
+                "--token",
+                "xoxb-test",
+                "--channel",
+                "C123",
+                "--output",
+                "test.json",
+            ],
+        )
+
         # Mock parser instance and methods
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        mock_parser = mock_parser_class.return_value
 
         # Mock messages
         mock_msg = Mock()
@@ -309,16 +314,24 @@ class TestMainFunction:
             [mock_msg], "test.json", "json"
         )
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch(
-        "sys.argv",
-        ["slackdump", "--token", "xoxb-test", "--channel", "C123", "--regex", "hello"],
-    )
-    def test_main_with_regex_filter(self, mock_parser_class):
+    def test_main_with_regex_filter(self, monkeypatch, mock_parser_class):
         """Test main execution with regex filter."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "slackdump",
+                "--token",
+                "xoxb-test",
+                "--channel",
+                "C123",
+                "--regex",
+                "hello",
+            ],
+        )
+
         # Mock parser instance
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        mock_parser = mock_parser_class.return_value
         mock_parser.get_channel_messages.return_value = [Mock()]
         mock_parser.filter_messages.return_value = [Mock()]
 
@@ -331,23 +344,23 @@ class TestMainFunction:
         filters_arg = mock_parser.filter_messages.call_args[0][1]
         assert len(filters_arg) > 0  # At least one filter was applied
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch(
-        "sys.argv",
-        [
-            "slackdump",
-            "--token",
-            "xoxb-test",
-            "--channel",
-            "C123",
-            "--start-time",
-            "invalid-date",
-        ],
-    )
-    def test_main_with_invalid_date(self, mock_parser_class):
+    def test_main_with_invalid_date(self, monkeypatch, mock_parser_class):
         """Test main execution with invalid date format."""
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "slackdump",
+                "--token",
+                "xoxb-test",
+                "--channel",
+                "C123",
+                "--start-time",
+                "invalid-date",
+            ],
+        )
+
+        mock_parser = mock_parser_class.return_value
         mock_parser.get_channel_messages.return_value = [Mock()]
 
         with patch("builtins.print") as mock_print:
@@ -360,12 +373,13 @@ class TestMainFunction:
             error_printed = any("Invalid date format" in call for call in print_calls)
             assert error_printed
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"])
-    def test_main_no_messages_found(self, mock_parser_class):
+    def test_main_no_messages_found(self, monkeypatch, mock_parser_class):
         """Test main execution when no messages found."""
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"]
+        )
+
+        mock_parser = mock_parser_class.return_value
         mock_parser.get_channel_messages.return_value = []  # No messages
 
         with patch("builtins.print") as mock_print:
@@ -375,12 +389,13 @@ class TestMainFunction:
             assert exc_info.value.code == 0  # Successful exit, just no messages
             mock_print.assert_any_call("⚠️  No messages found in channel")
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"])
-    def test_main_keyboard_interrupt(self, mock_parser_class):
+    def test_main_keyboard_interrupt(self, monkeypatch, mock_parser_class):
         """Test main execution with keyboard interrupt."""
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"]
+        )
+
+        mock_parser = mock_parser_class.return_value
         mock_parser.get_channel_messages.side_effect = KeyboardInterrupt()
 
         with patch("builtins.print") as mock_print:
@@ -390,10 +405,12 @@ class TestMainFunction:
             assert exc_info.value.code == 1
             mock_print.assert_any_call("\n⚠️  Operation cancelled by user")
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"])
-    def test_main_connection_error(self, mock_parser_class):
+    def test_main_connection_error(self, monkeypatch, mock_parser_class):
         """Test main execution with connection error."""
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"]
+        )
+
         mock_parser_class.side_effect = ConnectionError("Network error occurred")
 
         with patch("builtins.print") as mock_print:
@@ -403,10 +420,12 @@ class TestMainFunction:
             assert exc_info.value.code == 1
             mock_print.assert_any_call("❌ Network Error: Network error occurred")
 
-    @patch("slackdump.cli.SlackMessageParser")
-    @patch("sys.argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"])
-    def test_main_value_error(self, mock_parser_class):
+    def test_main_value_error(self, monkeypatch, mock_parser_class):
         """Test main execution with configuration error."""
+        monkeypatch.setattr(
+            sys, "argv", ["slackdump", "--token", "xoxb-test", "--channel", "C123"]
+        )
+
         mock_parser_class.side_effect = ValueError("Invalid token")
 
         with patch("builtins.print") as mock_print:
@@ -1,16 +1,43 @@
 """Tests for SlackDump filtering functionality."""
 
+import time
+
 import pytest
 from datetime import datetime
 
 from slackdump.parser import SlackMessage
 from slackdump.filters import (
+    _RE2_MIN_TEXT_LENGTH,
     TimeRangeFilter,
     RegexFilter,
     AuthorFilter,
     SlackMessageFilter,
 )
 
+# Filter bounds shared across tests (naive local time, like the CLI's)
+JAN_1 = datetime(2023, 1, 1)
+JAN_10 = datetime(2023, 1, 10)
+JAN_15 = datetime(2023, 1, 15)
+JAN_20 = datetime(2023, 1, 20)
+JUN_1 = datetime(2023, 6, 1)
+DEC_31 = datetime(2023, 12, 31)
+
+# Appended to message texts so RegexFilter takes its RE2 path when installed
+RE2_PADDING = " " * _RE2_MIN_TEXT_LENGTH
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    """Run a test with America/New_York as the local timezone."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+
+    with monkeypatch.context() as patched:
+        patched.setenv("TZ", "America/New_York")
+        time.tzset()
+        yield
+    time.tzset()
+
 
 class TestSlackMessageFilter:
     """Test base SlackMessageFilter class."""
@@ -35,97 +62,105 @@ class TestTimeRangeFilter:
 
     def test_init_start_time_only(self):
         """Test initialization with only start time."""
-        start = datetime(2023, 1, 1)
+        start = JAN_1
         filter_obj = TimeRangeFilter(start_time=start)
         assert filter_obj.start_time == start
         assert filter_obj.end_time is None
 
     def test_init_end_time_only(self):
         """Test initialization with only end time."""
-        end = datetime(2023, 12, 31)
+        end = DEC_31
         filter_obj = TimeRangeFilter(end_time=end)
         assert filter_obj.start_time is None
         assert filter_obj.end_time == end
 
     def test_init_both_times(self):
         """Test initialization with both start and end times."""
-        start = datetime(2023, 1, 1)
-        end = datetime(2023, 12, 31)
+        start = JAN_1
+        end = DEC_31
         filter_obj = TimeRangeFilter(start_time=start, end_time=end)
         assert filter_obj.start_time == start
         assert filter_obj.end_time == end
 
     def test_init_invalid_range(self):
         """Test initialization with invalid time range."""
-        start = datetime(2023, 12, 31)
-        end = datetime(2023, 1, 1)
+        start = DEC_31
+        end = JAN_1
 
-        with pytest.raises(ValueError, match="start_time must be before end_time"):
+        with pytest.raises(ValueError) as exc_info:
             TimeRangeFilter(start_time=start, end_time=end)
+        assert "start_time must be before end_time" in str(exc_info.value)
 
-    def test_filter_no_bounds(self):
+    def test_filter_no_bounds(self, make_message):
         """Test filtering with no time bounds (should pass all)."""
         filter_obj = TimeRangeFilter()
 
-        msg = SlackMessage("test", "U123", 1672531200.0, "C123")  # 2023-01-01
+        msg = make_message()  # 2023-01-01
         assert filter_obj(msg) is True
 
-    def test_filter_start_time_only(self):
+    def test_filter_start_time_only(self, make_message):
         """Test filtering with only start time."""
-        start = datetime(2023, 1, 15)  # Jan 15, 2023
+        start = JAN_15
         filter_obj = TimeRangeFilter(start_time=start)
 
         # Message before start time
-        msg_before = SlackMessage("test", "U123", 1672531200.0, "C123")  # 2023-01-01
+        msg_before = make_message()  # 2023-01-01
         assert filter_obj(msg_before) is False
 
         # Message after start time
-        msg_after = SlackMessage("test", "U123", 1674777600.0, "C123")  # 2023-01-27
+        msg_after = make_message(timestamp=1674777600.0)  # 2023-01-27
         assert filter_obj(msg_after) is True
 
         # Message exactly at start time
-        msg_exact = SlackMessage(
-            "test", "U123", 1673827200.0, "C123"
-        )  # 2023-01-15 12:00:00
+        msg_exact = make_message(timestamp=1673827200.0)  # 2023-01-15 12:00:00
         assert filter_obj(msg_exact) is True
 
-    def test_filter_end_time_only(self):
+    def test_filter_end_time_only(self, make_message):
         """Test filtering with only end time."""
-        end = datetime(2023, 1, 15)  # Jan 15, 2023
+        end = JAN_15
         filter_obj = TimeRangeFilter(end_time=end)
 
         # Message before end time
-        msg_before = SlackMessage("test", "U123", 1672531200.0, "C123")  # 2023-01-01
+        msg_before = make_message()  # 2023-01-01
         assert filter_obj(msg_before) is True
 
         # Message after end time
-        msg_after = SlackMessage("test", "U123", 1674777600.0, "C123")  # 2023-01-27
+        msg_after = make_message(timestamp=1674777600.0)  # 2023-01-27
         assert filter_obj(msg_after) is False
 
         # Message exactly at end time (start of day)
-        msg_exact = SlackMessage(
-            "test", "U123", 1673712000.0, "C123"
-        )  # 2023-01-15 00:00:00
+        msg_exact = make_message(timestamp=1673712000.0)  # 2023-01-15 00:00:00
         assert filter_obj(msg_exact) is True
 
-    def test_filter_both_times(self):
+    def test_filter_both_times(self, make_message):
         """Test filtering with both start and end times."""
-        start = datetime(2023, 1, 10)
-        end = datetime(2023, 1, 20)
+        start = JAN_10
+        end = JAN_20
         filter_obj = TimeRangeFilter(start_time=start, end_time=end)
 
         # Message before range
-        msg_before = SlackMessage("test", "U123", 1672531200.0, "C123")  # 2023-01-01
+        msg_before = make_message()  # 2023-01-01
         assert filter_obj(msg_before) is False
 
         # Message in range
-        msg_in_range = SlackMessage("test", "U123", 1673827200.0, "C123")  # 2023-01-15
+        msg_in_range = make_message(timestamp=1673827200.0)  # 2023-01-15
         assert filter_obj(msg_in_range) is True
 
         # Message after range
-        msg_after = SlackMessage("test", "U123", 1674777600.0, "C123")  # 2023-01-27
+        msg_after = make_message(timestamp=1674777600.0)  # 2023-01-27
         assert filter_obj(msg_after) is False
 
+    @pytest.mark.usefixtures("new_york_time")
+    def test_filter_end_time_in_repeated_hour(self, make_message):
+        """Test a bound in the DST fall-back hour means its first occurrence."""
+        filter_obj = TimeRangeFilter(end_time=datetime(2023, 11, 5, 1, 45))
+
+        first = datetime(2023, 11, 5, 1, 30).timestamp()
+        second = datetime(2023, 11, 5, 1, 30, fold=1).timestamp()
+
+        assert filter_obj(make_message(timestamp=first)) is True
+        assert filter_obj(make_message(timestamp=second)) is False
+
 
 class TestRegexFilter:
     """Test RegexFilter class."""
@@ -144,75 +179,123 @@ class TestRegexFilter:
 
     def test_init_invalid_regex(self):
         """Test initialization with invalid regex pattern."""
-        with pytest.raises(ValueError, match="Invalid regex pattern"):
+        with pytest.raises(ValueError) as exc_info:
             RegexFilter("[invalid")
+        assert "Invalid regex pattern" in str(exc_info.value)
 
-    def test_filter_case_insensitive(self):
+    def test_filter_case_insensitive(self, make_message):
         """Test case insensitive regex filtering."""
         filter_obj = RegexFilter("hello")
 
         # Matching cases
-        msg_lower = SlackMessage("hello world", "U123", 1672531200.0, "C123")
+        msg_lower = make_message("hello world")
         assert filter_obj(msg_lower) is True
 
-        msg_upper = SlackMessage("HELLO WORLD", "U123", 1672531200.0, "C123")
+        msg_upper = make_message("HELLO WORLD")
         assert filter_obj(msg_upper) is True
 
-        msg_mixed = SlackMessage("Hello World", "U123", 1672531200.0, "C123")
+        msg_mixed = make_message("Hello World")
         assert filter_obj(msg_mixed) is True
 
         # Non-matching case
-        msg_no_match = SlackMessage("goodbye world", "U123", 1672531200.0, "C123")
+        msg_no_match = make_message("goodbye world")
         assert filter_obj(msg_no_match) is False
 
-    def test_filter_case_sensitive(self):
+    def test_filter_case_sensitive(self, make_message):
         """Test case sensitive regex filtering."""
         filter_obj = RegexFilter("Hello", case_sensitive=True)
 
         # Matching case
-        msg_match = SlackMessage("Hello World", "U123", 1672531200.0, "C123")
+        msg_match = make_message("Hello World")
         assert filter_obj(msg_match) is True
 
         # Non-matching cases
-        msg_lower = SlackMessage("hello world", "U123", 1672531200.0, "C123")
+        msg_lower = make_message("hello world")
         assert filter_obj(msg_lower) is False
 
-        msg_upper = SlackMessage("HELLO WORLD", "U123", 1672531200.0, "C123")
+        msg_upper = make_message("HELLO WORLD")
         assert filter_obj(msg_upper) is False
 
-        msg_no_match = SlackMessage("goodbye world", "U123", 1672531200.0, "C123")
+        msg_no_match = make_message("goodbye world")
         assert filter_obj(msg_no_match) is False
 
-    def test_filter_complex_regex(self):
+    def test_filter_complex_regex(self, make_message):
         """Test complex regex patterns."""
         # Test word boundaries
         filter_obj = RegexFilter(r"\berror\b")
 
-        msg_match = SlackMessage("An error occurred", "U123", 1672531200.0, "C123")
+        msg_match = make_message("An error occurred")
         assert filter_obj(msg_match) is True
 
-        msg_no_match = SlackMessage("No errors here", "U123", 1672531200.0, "C123")
+        msg_no_match = make_message("No errors here")
         assert filter_obj(msg_no_match) is False
 
-        msg_partial = SlackMessage("terrorism is bad", "U123", 1672531200.0, "C123")
+        msg_partial = make_message("terrorism is bad")
         assert filter_obj(msg_partial) is False
 
-    def test_filter_multiple_patterns(self):
+    def test_filter_multiple_patterns(self, make_message):
         """Test regex with multiple patterns (OR logic)."""
         filter_obj = RegexFilter(r"error|warning|fail")
 
-        msg_error = SlackMessage("An error occurred", "U123", 1672531200.0, "C123")
+        msg_error = make_message("An error occurred")
         assert filter_obj(msg_error) is True
 
-        msg_warning = SlackMessage("Warning: something", "U123", 1672531200.0, "C123")
+        msg_warning = make_message("Warning: something")
         assert filter_obj(msg_warning) is True
 
-        msg_fail = SlackMessage("Operation failed", "U123", 1672531200.0, "C123")
+        msg_fail = make_message("Operation failed")
         assert filter_obj(msg_fail) is True
 
-        msg_no_match = SlackMessage("Everything is fine", "U123", 1672531200.0, "C123")
+        msg_no_match = make_message("Everything is fine")
         assert filter_obj(msg_no_match) is False
 
+    def test_filter_lookaround(self, make_message):
+        """Test patterns outside the RE2 subset still match like re."""
+        filter_obj = RegexFilter(r"deploy(?! was rolled back)")
+
+        msg_match = make_message("deploy succeeded" + RE2_PADDING)
+        assert filter_obj(msg_match) is True
+
+        msg_no_match = make_message("deploy was rolled back" + RE2_PADDING)
+        assert filter_obj(msg_no_match) is False
+
+    @pytest.mark.parametrize(
+        "pattern, text",
+        [
+            ("fail", "FA\u0130L"),
+            ("hi", "H\u0130"),
+            ("[a-z]+", "\u0131"),
+            ("(?i)FAIL", "fa\u0131l"),
+        ],
+        ids=["dotted_capital_i", "short_literal", "char_class", "inline_flag"],
+    )
+    def test_filter_case_insensitive_dotted_i(self, make_message, pattern, text):
+        """Test re's i/\u0130/\u0131 case folding survives the RE2 fast path."""
+        filter_obj = RegexFilter(pattern)
+
+        assert filter_obj(make_message(text)) is True
+        assert filter_obj(make_message(text + RE2_PADDING)) is True
+
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_filter_agrees_with_re(self, make_message, case_sensitive):
+        """Test short and long texts match exactly as re would."""
+        patterns = ["fail", "error|warn", "[a-z]+", "k", "st", "^deploy", "x{2,}"]
+        texts = ["FAIL", "FA\u0130L", "\u0131", "\u212a", "\ufb06", "deploy", "xx"]
+
+        for pattern in patterns:
+            filter_obj = RegexFilter(pattern, case_sensitive=case_sensitive)
+            for text in texts + [text + RE2_PADDING for text in texts]:
+                assert filter_obj(make_message(text)) == bool(
+                    filter_obj.regex.search(text)
+                ), (pattern, text)
+
+    @pytest.mark.parametrize("padding", ["", RE2_PADDING], ids=["short", "long"])
+    def test_filter_lone_surrogate(self, make_message, padding):
+        """Test text that cannot be encoded as UTF-8 still matches."""
+        filter_obj = RegexFilter("ERROR", case_sensitive=True)
+
+        assert filter_obj(make_message("bad \ud83d ERROR" + padding)) is True
+
 
 class TestAuthorFilter:
     """Test AuthorFilter class."""
@@ -221,6 +304,7 @@ class TestAuthorFilter:
         """Test initialization with single user."""
         filter_obj = AuthorFilter(["U123"])
         assert filter_obj.user_ids == {"U123"}
+        assert isinstance(filter_obj.user_ids, frozenset)
 
     def test_init_multiple_users(self):
         """Test initialization with multiple users."""
@@ -230,8 +314,9 @@ class TestAuthorFilter:
 
     def test_init_empty_users(self):
         """Test initialization with empty user list."""
-        with pytest.raises(ValueError, match="user_ids cannot be empty"):
+        with pytest.raises(ValueError) as exc_info:
             AuthorFilter([])
+        assert "user_ids cannot be empty" in str(exc_info.value)
 
     def test_filter_allowed_user(self):
         """Test filtering with allowed user."""
@@ -265,9 +350,7 @@ class TestFilterCombinations:
     def test_multiple_filters_all_pass(self):
         """Test message that passes all filters."""
         # Create filters
-        time_filter = TimeRangeFilter(
-            start_time=datetime(2023, 1, 1), end_time=datetime(2023, 12, 31)
-        )
+        time_filter = TimeRangeFilter(start_time=JAN_1, end_time=DEC_31)
         regex_filter = RegexFilter("hello")
         author_filter = AuthorFilter(["U123"])
 
@@ -281,9 +364,7 @@ class TestFilterCombinations:
     def test_multiple_filters_one_fails(self):
         """Test message that fails one filter."""
         # Create filters
-        time_filter = TimeRangeFilter(
-            start_time=datetime(2023, 6, 1), end_time=datetime(2023, 12, 31)  # June 1st
-        )
+        time_filter = TimeRangeFilter(start_time=JUN_1, end_time=DEC_31)
         regex_filter = RegexFilter("hello")
         author_filter = AuthorFilter(["U123"])
 
@@ -294,6 +375,56 @@ class TestFilterCombinations:
         assert regex_filter(msg) is True
         assert author_filter(msg) is True
 
+    def test_fuse_matches_all_filters(self):
+        """Test fused predicate passes only messages every filter accepts."""
+        fused = SlackMessageFilter.fuse(
+            [
+                RegexFilter("hello"),
+                TimeRangeFilter(start_time=JAN_1),
+                AuthorFilter(["U123"]),
+            ]
+        )
+
+        assert fused(SlackMessage("hello world", "U123", 1672531200.0, "C123"))
+        assert not fused(SlackMessage("hello world", "U456", 1672531200.0, "C123"))
+        # Mid-2023, inside the range in any local timezone
+        assert not fused(SlackMessage("goodbye", "U123", 1686000000.0, "C123"))
+
+    def test_fuse_runs_cheapest_filter_first(self):
+        """Test fused predicate checks authors, then time range, then regex."""
+        calls = []
+
+        class RecordingRegexFilter(RegexFilter):
+            def __call__(self, message):
+                calls.append("regex")
+                return super().__call__(message)
+
+        class RecordingTimeRangeFilter(TimeRangeFilter):
+            def __call__(self, message):
+                calls.append("time")
+                return super().__call__(message)
+
+        class RecordingAuthorFilter(AuthorFilter):
+            def __call__(self, message):
+                calls.append("author")
+                return super().__call__(message)
+
+        fused = SlackMessageFilter.fuse(
+            [
+                RecordingRegexFilter("hello"),
+                RecordingTimeRangeFilter(start_time=JAN_1, end_time=DEC_31),
+                RecordingAuthorFilter(["U123"]),
+            ]
+        )
+
+        # Mid-2023, inside the range in any local timezone
+        assert not fused(SlackMessage("goodbye", "U123", 1686000000.0, "C123"))
+        assert calls == ["author", "time", "regex"]
+
+        calls.clear()
+        assert not fused(SlackMessage("hello world", "U456", 1672531200.0, "C123"))
+        assert calls == ["author"]
+
     def test_edge_case_empty_message_text(self):
         """Test filters with empty message text."""
         regex_filter = RegexFilter("hello")
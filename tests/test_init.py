@@ -0,0 +1,49 @@
+"""Tests for SlackDump's lazily loaded package namespace."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import slackdump
+from slackdump.parser import SlackMessageParser
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImports:
+    """Test the PEP 562 __getattr__ and __dir__ hooks."""
+
+    def test_public_name_resolves(self, monkeypatch):
+        """Test a public name loads from its submodule on first access."""
+        # Drop any value cached by an earlier access so __getattr__ runs
+        monkeypatch.delitem(vars(slackdump), "SlackMessageParser", raising=False)
+
+        assert slackdump.SlackMessageParser is SlackMessageParser
+        assert vars(slackdump)["SlackMessageParser"] is SlackMessageParser
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test names outside the public API raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'NotAThing'"):
+            slackdump.NotAThing
+
+    def test_dir_lists_lazy_names(self):
+        """Test dir() includes public names before they are loaded."""
+        assert set(slackdump.__all__) <= set(dir(slackdump))
+
+    def test_cli_import_skips_requests(self):
+        """Test importing the CLI leaves requests unloaded until it is needed."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, slackdump.cli; print('requests' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT,
+        )
+
+        assert result.stdout.strip() == "False"